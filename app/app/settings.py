@@ -79,7 +79,8 @@ DATABASES = {
         'NAME': os.getenv('SQL_DATABASE'),
         'USER': os.getenv('SQL_USER'),
         'PASSWORD': os.getenv('SQL_PASSWORD'),
-        'PORT': os.getenv('SQL_PORT')
+        'PORT': os.getenv('SQL_PORT'),
+        'CONN_MAX_AGE': int(os.getenv('SQL_CONN_MAX_AGE', 60)),
     }
 }
 
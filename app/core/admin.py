@@ -3,10 +3,41 @@ Django Admin customization.
 """
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from . import models
 
+AMENITY_LOOKUPS_CACHE_KEY = 'amenity_lookups'
+
+
+class EstimateCountPaginator(Paginator):
+    """Paginator that estimates the row count for unfiltered querysets."""
+
+    @cached_property
+    def count(self):
+        if connection.vendor == 'postgresql' and not self.object_list.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [self.object_list.model._meta.db_table],
+                )
+                estimate = cursor.fetchone()[0]
+            if estimate >= 0:
+                return estimate
+        return super().count
+
+
+class EstimateCountAdminMixin:
+    """Use the catalog row estimate instead of COUNT(*) for changelist pagination."""
+    paginator = EstimateCountPaginator
+    show_full_result_count = False
+
 
 class UserAdmin(BaseUserAdmin):
     """Define the admin pages for users."""
@@ -42,11 +73,74 @@ class UserAdmin(BaseUserAdmin):
     )
 
 
-class CottageAdmin(admin.ModelAdmin):
-    list_filter = ['category', 'amenities', 'price_per_night', 'total_capacity']
+class PriceRangeFilter(admin.SimpleListFilter):
+    """Bucketed filter for the continuous price_per_night field."""
+    title = _('price per night')
+    parameter_name = 'price_range'
+
+    ranges = {
+        'low': (0, 100),
+        'medium': (100, 500),
+        'high': (500, None),
+    }
+
+    def lookups(self, request, model_admin):
+        return [
+            ('low', _('Under 100')),
+            ('medium', _('100 to 500')),
+            ('high', _('Over 500')),
+        ]
+
+    def queryset(self, request, queryset):
+        if self.value() not in self.ranges:
+            return queryset
+        low, high = self.ranges[self.value()]
+        if high is None:
+            return queryset.filter(price_per_night__gte=low)
+        return queryset.filter(price_per_night__gte=low, price_per_night__lt=high)
+
+
+class CachedAmenityFilter(admin.SimpleListFilter):
+    """Amenity filter whose choices are cached instead of queried per render."""
+    title = _('amenity')
+    parameter_name = 'amenities'
+
+    def lookups(self, request, model_admin):
+        lookups = cache.get(AMENITY_LOOKUPS_CACHE_KEY)
+        if lookups is None:
+            lookups = list(models.Amenities.objects.values_list('id', 'name'))
+            cache.set(AMENITY_LOOKUPS_CACHE_KEY, lookups, 60 * 60)
+        return lookups
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(amenities__id=self.value())
+        return queryset
+
+
+@receiver(post_save, sender=models.Amenities)
+@receiver(post_delete, sender=models.Amenities)
+def invalidate_amenity_lookups(sender, **kwargs):
+    """Drop the cached filter choices when an amenity changes."""
+    cache.delete(AMENITY_LOOKUPS_CACHE_KEY)
+
+
+class AmenitiesAdmin(admin.ModelAdmin):
+    """Define the admin pages for amenities."""
+    search_fields = ['name']
+
+
+class CottageAdmin(EstimateCountAdminMixin, admin.ModelAdmin):
+    list_filter = ['category', PriceRangeFilter, CachedAmenityFilter]
+    search_fields = ['name']
+    autocomplete_fields = ['amenities']
+
+
+class BookingAdmin(EstimateCountAdminMixin, admin.ModelAdmin):
+    """Define the admin pages for bookings."""
 
 
 admin.site.register(models.User, UserAdmin)
-admin.site.register(models.Amenities)
+admin.site.register(models.Amenities, AmenitiesAdmin)
 admin.site.register(models.Cottage, CottageAdmin)
-admin.site.register(models.Booking)
+admin.site.register(models.Booking, BookingAdmin)
@@ -0,0 +1,21 @@
+# Generated by Django 4.0.10 on 2026-08-31 19:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0019_cottage_base_expenses'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['cottage', 'check_in', 'check_out'], name='core_bookin_cottage_02003f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['customer_email', 'check_in', 'check_out'], name='core_bookin_custome_469b25_idx'),
+        ),
+    ]
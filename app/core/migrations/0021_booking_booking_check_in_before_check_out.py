@@ -0,0 +1,18 @@
+# Generated by Django 4.0.10 on 2026-08-31 19:07
+
+from django.db import migrations, models
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0020_booking_core_bookin_cottage_02003f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=models.CheckConstraint(check=models.Q(('check_in__lt', django.db.models.expressions.F('check_out'))), name='booking_check_in_before_check_out'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.0.10 on 2026-08-31 19:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0021_booking_booking_check_in_before_check_out'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cottage',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.0.10 on 2026-08-31 19:16
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0022_cottage_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FinancialSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_income', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('total_expenses', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Financial summaries',
+            },
+        ),
+    ]
@@ -1,17 +1,23 @@
-from decimal import Decimal
+from decimal import Decimal, ROUND_HALF_UP, localcontext
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Q, Sum
 from django.contrib.auth.models import (
     AbstractBaseUser,
     BaseUserManager,
     PermissionsMixin
 )
 from django.conf import settings
-from django.db.models.signals import m2m_changed
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 from rest_framework.exceptions import ValidationError
 
+DISCOUNT_FACTOR = Decimal('0.80')
+DISCOUNT_MONTHS = frozenset((3, 11))
+TWO_PLACES = Decimal('0.01')
+
 
 class UserManager(BaseUserManager):
     """Manager for users."""
@@ -79,6 +85,7 @@ class Cottage(models.Model):
     price_per_night = models.DecimalField(max_digits=10, decimal_places=2)
     base_expenses = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     expenses = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE
@@ -86,9 +93,12 @@ class Cottage(models.Model):
 
     def calculate_total_capacity_and_expenses(self):
         """Calculate the total capacity and expenses of the cottage including amenities."""
-        additional_capacity = sum(amenity.additional_capacity for amenity in self.amenities.all())
-        self.total_capacity = self.total_capacity + additional_capacity
-        self.expenses = self.base_expenses + sum(amenity.expenses for amenity in self.amenities.all())
+        totals = self.amenities.aggregate(
+            capacity=Sum('additional_capacity'),
+            expenses=Sum('expenses'),
+        )
+        self.total_capacity = self.total_capacity + (totals['capacity'] or 0)
+        self.expenses = self.base_expenses + (totals['expenses'] or 0)
 
     def __str__(self):
         return f'{self.name}, {self.category}, max. guests - {self.total_capacity}, price - {self.price_per_night}'
@@ -97,8 +107,15 @@ class Cottage(models.Model):
 @receiver(m2m_changed, sender=Cottage.amenities.through)
 def update_total_capacity_and_expenses(sender, instance, **kwargs):
     """Update total capacity and expenses when amenities are added or removed."""
+    if kwargs.get('reverse') or kwargs.get('action') not in ('post_add', 'post_remove', 'post_clear'):
+        return
     instance.calculate_total_capacity_and_expenses()
-    instance.save()
+    Cottage.objects.filter(pk=instance.pk).update(
+        total_capacity=instance.total_capacity,
+        expenses=instance.expenses,
+        updated_at=timezone.now(),
+    )
+    FinancialSummary.objects.filter(user_id=instance.user_id).delete()
 
 
 class Booking(models.Model):
@@ -115,6 +132,18 @@ class Booking(models.Model):
     price = models.DecimalField(max_digits=10, decimal_places=2, default=0, editable=False)
     is_confirmed = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['cottage', 'check_in', 'check_out']),
+            models.Index(fields=['customer_email', 'check_in', 'check_out']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=Q(check_in__lt=F('check_out')),
+                name='booking_check_in_before_check_out',
+            ),
+        ]
+
     def calculate_price(self):
         """Calculate the price based on the number of nights and cottage price."""
         if isinstance(self.check_in, str):
@@ -123,45 +152,94 @@ class Booking(models.Model):
             self.check_out = parse_date(self.check_out)
 
         nights = (self.check_out - self.check_in).days
-        if nights <= 0:
-            raise ValidationError("Invalid dates: Check-out must be after check-in.")
 
-        amenities_total_price = sum(amenity.price for amenity in self.cottage.amenities.all())
+        amenities_total_price = self.cottage.amenities.aggregate(total=Sum('price'))['total'] or 0
+
+        price_per_night = self.cottage.price_per_night
+        if not isinstance(price_per_night, Decimal):
+            price_per_night = Decimal(price_per_night)
+
+        with localcontext() as ctx:
+            ctx.prec = 12
+            ctx.rounding = ROUND_HALF_UP
 
-        price = (Decimal(self.cottage.price_per_night) + Decimal(amenities_total_price)) * Decimal(nights)
+            price = (price_per_night + amenities_total_price) * nights
 
-        if self.check_in.month in [11, 3] or self.check_out.month in [11, 3]:
-            discount = price * Decimal('0.20')
-            price -= discount
+            if self.check_in.month in DISCOUNT_MONTHS or self.check_out.month in DISCOUNT_MONTHS:
+                price *= DISCOUNT_FACTOR
 
-        return price
+            return price.quantize(TWO_PLACES)
 
     def clean(self):
-        overlapping_bookings = Booking.objects.filter(
-            cottage=self.cottage,
+        if self.check_in >= self.check_out:
+            raise ValidationError('Check-out date must be later than check-in date.')
+
+        conflicting_bookings = Booking.objects.filter(
             check_in__lt=self.check_out,
             check_out__gt=self.check_in,
+        ).filter(
+            Q(cottage=self.cottage) | Q(customer_email=self.customer_email)
         ).exclude(id=self.id)
 
-        if overlapping_bookings.exists():
-            raise ValidationError('This cottage is already booked for the selected dates.')
+        if conflicting_bookings.exists():
+            raise ValidationError(
+                'The cottage or the customer already has a booking for the selected dates.'
+            )
 
-        customer_bookings = Booking.objects.filter(
-            customer_email=self.customer_email,
-            check_in__lt=self.check_out,
-            check_out__gt=self.check_in
-        ).exclude(id=self.id)
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            Cottage.objects.select_for_update().only('id').get(pk=self.cottage_id)
+            self.clean()
+            self.price = self.calculate_price()
+            try:
+                super().save(*args, **kwargs)
+            except IntegrityError:
+                raise ValidationError('Check-out date must be later than check-in date.')
 
-        if customer_bookings.exists():
-            raise ValidationError('This customer already has a booking in another cottage for the selected dates.')
+    def __str__(self):
+        return f'Booking for {self.customer_name} in {self.cottage.name}, {self.price}$'
 
-        if self.check_in >= self.check_out:
-            raise ValidationError('Check-out date must be later than check-in date.')
 
-    def save(self, *args, **kwargs):
-        self.clean()
-        self.price = self.calculate_price()
-        super().save(*args, **kwargs)
+class FinancialSummary(models.Model):
+    """Denormalized income and expense totals per owner for fast reports."""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE
+    )
+    total_income = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    total_expenses = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name_plural = "Financial summaries"
 
     def __str__(self):
-        return f'Booking for {self.customer_name} in {self.cottage.name}, {self.price}$'
+        return f'Financial summary for {self.user}'
+
+
+@receiver(pre_save, sender=Booking)
+def remember_previous_cottage(sender, instance, **kwargs):
+    """Track which cottage a persisted booking pointed at before this save."""
+    if instance.pk:
+        instance._previous_cottage_id = (
+            Booking.objects.filter(pk=instance.pk)
+            .values_list('cottage_id', flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Booking)
+@receiver(post_delete, sender=Booking)
+def invalidate_financial_summary_on_booking_change(sender, instance, **kwargs):
+    """Drop the cached summaries of the owners affected by a booking change."""
+    cottage_ids = {instance.cottage_id}
+    previous_cottage_id = getattr(instance, '_previous_cottage_id', None)
+    if previous_cottage_id:
+        cottage_ids.add(previous_cottage_id)
+    FinancialSummary.objects.filter(user__cottage__in=cottage_ids).delete()
+
+
+@receiver(post_save, sender=Cottage)
+@receiver(post_delete, sender=Cottage)
+def invalidate_financial_summary_on_cottage_change(sender, instance, **kwargs):
+    """Drop the cached summary of the owner when a cottage changes."""
+    FinancialSummary.objects.filter(user_id=instance.user_id).delete()
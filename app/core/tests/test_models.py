@@ -6,7 +6,7 @@ from decimal import Decimal
 
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 
 from core import models
@@ -18,6 +18,9 @@ def create_user(email='user@example.com', password='testpass123'):
     return get_user_model().objects.create_user(email, password)
 
 
+@override_settings(
+    PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']
+)
 class ModelTests(TestCase):
     """Test models."""
 
@@ -74,7 +77,7 @@ class ModelTests(TestCase):
 
         self.assertEqual('Sample cottage name', cottage.name)
         self.assertEqual(5, cottage.total_capacity)
-        self.assertEqual(Decimal(500.50), cottage.price_per_night)
+        self.assertEqual(Decimal('500.50'), cottage.price_per_night)
 
     def test_create_amenity(self):
         """Test creating an amenity is successful."""
@@ -133,3 +136,95 @@ class ModelTests(TestCase):
         self.assertEqual(booking.check_out, check_out)
         self.assertEqual(booking.customer_name, "username")
         self.assertEqual(booking.cottage, cottage)
+
+    def test_financial_summary_invalidated_on_booking_change(self):
+        """Test a booking create and delete drops the owner's summary."""
+        user = create_user()
+        cottage = models.Cottage.objects.create(
+            name='Sample cottage name',
+            total_capacity=5,
+            price_per_night=Decimal('500.50'),
+            user=user
+        )
+        check_in = timezone.now().date() + timedelta(days=1)
+
+        models.FinancialSummary.objects.create(user=user)
+        booking = models.Booking.objects.create(
+            cottage=cottage,
+            check_in=check_in,
+            check_out=check_in + timedelta(days=2),
+            customer_name="username",
+            customer_email="example@example.com",
+            user=user
+        )
+
+        self.assertFalse(
+            models.FinancialSummary.objects.filter(user=user).exists()
+        )
+
+        models.FinancialSummary.objects.create(user=user)
+        booking.delete()
+
+        self.assertFalse(
+            models.FinancialSummary.objects.filter(user=user).exists()
+        )
+
+    def test_financial_summary_invalidated_on_amenities_change(self):
+        """Test changing a cottage's amenities drops the owner's summary."""
+        user = create_user()
+        amenity = models.Amenities.objects.create(
+            name='Sample amenity name',
+            additional_capacity=1,
+            user=user
+        )
+        cottage = models.Cottage.objects.create(
+            name='Sample cottage name',
+            total_capacity=5,
+            price_per_night=Decimal('500.50'),
+            user=user
+        )
+
+        models.FinancialSummary.objects.create(user=user)
+        cottage.amenities.add(amenity)
+
+        self.assertFalse(
+            models.FinancialSummary.objects.filter(user=user).exists()
+        )
+
+    def test_financial_summary_invalidated_for_previous_cottage_owner(self):
+        """Test re-assigning a booking drops both owners' summaries."""
+        user = create_user()
+        other_user = create_user(email='other@example.com')
+        cottage = models.Cottage.objects.create(
+            name='Sample cottage name',
+            total_capacity=5,
+            price_per_night=Decimal('500.50'),
+            user=user
+        )
+        other_cottage = models.Cottage.objects.create(
+            name='Other cottage name',
+            total_capacity=5,
+            price_per_night=Decimal('500.50'),
+            user=other_user
+        )
+        check_in = timezone.now().date() + timedelta(days=1)
+        booking = models.Booking.objects.create(
+            cottage=cottage,
+            check_in=check_in,
+            check_out=check_in + timedelta(days=2),
+            customer_name="username",
+            customer_email="example@example.com",
+            user=user
+        )
+
+        models.FinancialSummary.objects.create(user=user)
+        models.FinancialSummary.objects.create(user=other_user)
+        booking.cottage = other_cottage
+        booking.save()
+
+        self.assertFalse(
+            models.FinancialSummary.objects.filter(user=user).exists()
+        )
+        self.assertFalse(
+            models.FinancialSummary.objects.filter(user=other_user).exists()
+        )
@@ -1,8 +1,11 @@
 """
 Serializers for resort APIs.
 """
+from django.core.cache import cache
+
 from rest_framework import serializers
 
+from core.admin import AMENITY_LOOKUPS_CACHE_KEY
 from core.models import Cottage, Amenities, Booking
 
 
@@ -46,21 +49,36 @@ class CottageSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Cottage
-        fields = '__all__'
+        exclude = ['updated_at']
         read_only_fields = ['id']
 
     def _get_or_create_amenities(self, amenities, cottage):
         """Handle getting or creating amenities as needed."""
+        if not amenities:
+            return
         auth_user = self.context['request'].user
+        by_name = {}
         for amenity in amenities:
-            name = amenity.get('name')
-            additional_capacity = amenity.get('additional_capacity', 0)
-            amenity_obj, created = Amenities.objects.get_or_create(
+            by_name.setdefault(amenity.get('name'), amenity)
+        names = list(by_name)
+        existing = set(
+            Amenities.objects.filter(user=auth_user, name__in=names)
+            .values_list('name', flat=True)
+        )
+        to_create = [
+            Amenities(
                 user=auth_user,
                 name=name,
-                defaults={'additional_capacity': additional_capacity}
+                additional_capacity=amenity.get('additional_capacity', 0),
             )
-            cottage.amenities.add(amenity_obj)
+            for name, amenity in by_name.items() if name not in existing
+        ]
+        if to_create:
+            Amenities.objects.bulk_create(to_create)
+            cache.delete(AMENITY_LOOKUPS_CACHE_KEY)
+        cottage.amenities.add(
+            *Amenities.objects.filter(user=auth_user, name__in=names)
+        )
 
     def create(self, validated_data):
         """Create a cottage."""
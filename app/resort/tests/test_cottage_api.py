@@ -216,6 +216,14 @@ class AdminCottageApiTest(TestCase):
         self.assertIn(s2.data, res.data)
         self.assertNotIn(s3.data, res.data)
 
+    def test_filter_by_amenities_malformed(self):
+        """Test filtering cottages by malformed amenity IDs returns a 400."""
+        create_cottage(user=self.user)
+
+        res = self.client.get(COTTAGE_URL, {'amenities': 'one,two'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_filter_by_category(self):
         """Test filtering cottages by category."""
         c1 = create_cottage(user=self.user, name='Big House', category="luxury")
@@ -254,6 +262,19 @@ class PrivateCottageApiTest(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
 
+    def test_retrieve_cottages_with_limit(self):
+        """Test limiting the cottage list via limit/offset pagination."""
+        create_cottage(user=self.user, name='Cabin')
+        create_cottage(user=self.user, name='House')
+        create_cottage(user=self.user, name='Villa')
+
+        res = self.client.get(COTTAGE_URL, {'limit': 2})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['count'], 3)
+        self.assertEqual(len(res.data['results']), 2)
+        self.assertEqual(res.data['results'][0]['name'], 'Villa')
+
     def test_cottages_not_limited_to_user(self):
         """Test list of cottages is not limited for authenticated user."""
         other_user = create_user(email='user2@example.com')
@@ -304,3 +325,29 @@ class AdditionalFunctionalityTests(TestCase):
         self.assertEqual(res.data['total_expenses'], Decimal('320'))
         self.assertEqual(res.data['total_income'], Decimal('400'))
         self.assertEqual(res.data['net_profit'], Decimal('80'))
+
+    def test_financial_report_reflects_new_bookings(self):
+        """Test the financial report is refreshed after new bookings."""
+        cottage = create_cottage(user=self.user)
+
+        payload = {
+            'cottage': cottage.id,
+            'check_in': '2024-10-01',
+            'check_out': '2024-10-05',
+            'customer_name': 'John Doe',
+            'customer_email': 'john.doe@example.com',
+            'user': self.user.id
+        }
+        self.client.post(BOOKING_URL, payload, format='json')
+        res = self.client.get(REPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['total_income'], Decimal('400'))
+
+        payload.update({'check_in': '2024-10-06', 'check_out': '2024-10-10'})
+        self.client.post(BOOKING_URL, payload, format='json')
+        res = self.client.get(REPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['total_income'], Decimal('800'))
+        self.assertEqual(res.data['net_profit'], Decimal('800'))
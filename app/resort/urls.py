@@ -1,23 +1,48 @@
 """
 URL mapping for the resort app.
 """
-from django.urls import (
-    path,
-    include
-)
-from rest_framework.routers import DefaultRouter
+from django.urls import path
 
 from resort import views
 
-router = DefaultRouter()
-router.register('cottages', views.CottageViewSet)
-router.register('amenities', views.AmenitiesViewSet)
-router.register('booking', views.BookingViewSet)
-
 app_name = 'resort'
 
+cottage_list = views.CottageViewSet.as_view({
+    'get': 'list',
+    'post': 'create',
+})
+cottage_detail = views.CottageViewSet.as_view({
+    'get': 'retrieve',
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+})
+amenities_list = views.AmenitiesViewSet.as_view({
+    'get': 'list',
+    'post': 'create',
+})
+amenities_detail = views.AmenitiesViewSet.as_view({
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+})
+booking_list = views.BookingViewSet.as_view({
+    'get': 'list',
+    'post': 'create',
+})
+booking_detail = views.BookingViewSet.as_view({
+    'put': 'update',
+    'patch': 'partial_update',
+    'delete': 'destroy',
+})
+
 urlpatterns = [
-    path('', include(router.urls)),
+    path('cottages/', cottage_list, name='cottage-list'),
+    path('cottages/<int:pk>/', cottage_detail, name='cottage-detail'),
+    path('amenities/', amenities_list, name='amenities-list'),
+    path('amenities/<int:pk>/', amenities_detail, name='amenities-detail'),
+    path('booking/', booking_list, name='booking-list'),
+    path('booking/<int:pk>/', booking_detail, name='booking-detail'),
     path('check-availability/', views.CheckAvailabilityView.as_view(), name='check-availability'),
     path('cottage-availability/', views.CottageAvailabilityView.as_view(), name='cottage-availability'),
     path('financial-report/', views.FinancialReportView.as_view(), name='financial-report'),
@@ -1,9 +1,12 @@
 """
 Views for resort APIs.
 """
+from datetime import date
 from decimal import Decimal
 
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Prefetch, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from drf_spectacular.utils import (
@@ -18,7 +21,8 @@ from rest_framework import (
     status, generics,
 )
 from rest_framework.decorators import action
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
@@ -27,10 +31,25 @@ from core.models import (
     Cottage,
     Amenities,
     Booking,
+    FinancialSummary,
 )
 from resort import serializers
 from rest_framework.views import APIView
 
+class QueryParamFlagMixin:
+    """Mixin for reading boolean query params without int() parsing."""
+
+    def _flag(self, name):
+        """Return True if the query param is present and truthy."""
+        value = self.request.query_params.get(name)
+        return value not in (None, '', '0', 'false', 'False')
+
+
+_WRITE_ACTIONS = frozenset({'create', 'update', 'partial_update', 'destroy'})
+_ADMIN_PERMISSIONS = (IsAdminUser(),)
+_AUTHENTICATED_PERMISSIONS = (IsAuthenticated(),)
+_OPEN_PERMISSIONS = (AllowAny(),)
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -48,69 +67,109 @@ from rest_framework.views import APIView
         ]
     )
 )
-class CottageViewSet(viewsets.ModelViewSet):
+class CottageViewSet(QueryParamFlagMixin, viewsets.ModelViewSet):
     """Manage cottages in the database."""
     serializer_class = serializers.CottageSerializer
     queryset = Cottage.objects.all()
     authentication_classes = (TokenAuthentication,)
     permission_classes = (AllowAny,)
+    pagination_class = LimitOffsetPagination
 
     def get_permissions(self):
         """Set permissions based on the action."""
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            permission_classes = [IsAdminUser]
-        else:
-            permission_classes = [AllowAny]
-        return [permission() for permission in permission_classes]
+        if self.action in _WRITE_ACTIONS:
+            return _ADMIN_PERMISSIONS
+        return _OPEN_PERMISSIONS
 
     def _params_to_ints(self, qs):
-        """Convert a list of strings to integers."""
-        return [int(str_id) for str_id in qs.split(',')]
+        """Convert a comma separated list of strings to integers."""
+        try:
+            return list(map(int, qs.split(',')))
+        except ValueError:
+            raise ValidationError(
+                {'amenities': 'Must be a comma separated list of integer IDs.'}
+            )
 
     def get_queryset(self):
         """Filter queryset for user."""
-        assigned_only = bool(
-            int(self.request.query_params.get('assigned_only', 0))
-        )
+        assigned_only = self._flag('assigned_only')
         queryset = self.queryset
+        needs_distinct = False
         if assigned_only:
             queryset = queryset.filter(cottage__isnull=False)
         amenities = self.request.query_params.get('amenities')
         if amenities:
             amenity_ids = self._params_to_ints(amenities)
             queryset = queryset.filter(amenities__id__in=amenity_ids)
+            needs_distinct = True
 
         category = self.request.query_params.get('category')
         if category:
             queryset = queryset.filter(category__iexact=category)
-        return queryset.order_by('-name').distinct()
 
+        queryset = queryset.prefetch_related(
+            Prefetch('amenities', queryset=Amenities.objects.only('id', 'name'))
+        ).order_by('-name')
+        if needs_distinct:
+            queryset = queryset.distinct()
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """List cottages, reusing cached serializer output per cottage."""
+        queryset = self.filter_queryset(self.get_queryset())
+        probe = queryset.prefetch_related(None).only('id', 'updated_at')
+        page = self.paginate_queryset(probe)
+        rows = page if page is not None else list(probe)
+
+        keys = {
+            row.id: f'cottage:{row.id}:{row.updated_at.isoformat()}'
+            for row in rows
+        }
+        cached = cache.get_many(keys.values())
+
+        missing_ids = [row.id for row in rows if keys[row.id] not in cached]
+        missing = {}
+        if missing_ids:
+            for cottage in queryset.filter(id__in=missing_ids):
+                missing[cottage.id] = self.get_serializer(cottage).data
+            cache.set_many(
+                {keys[pk]: item for pk, item in missing.items()},
+                timeout=60 * 60,
+            )
+
+        data = [
+            cached[keys[row.id]] if keys[row.id] in cached else missing[row.id]
+            for row in rows
+        ]
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
 
-class BaseCottageAttrViewSet(mixins.UpdateModelMixin,
+
+class BaseCottageAttrViewSet(QueryParamFlagMixin,
+                             mixins.UpdateModelMixin,
                              mixins.DestroyModelMixin,
                              mixins.ListModelMixin,
                              viewsets.GenericViewSet):
     """Base viewset for cottage attributes."""
     authentication_classes = (TokenAuthentication,)
     permission_classes = (AllowAny,)
+    pagination_class = LimitOffsetPagination
 
     def get_permissions(self):
         """Set permissions based on the action."""
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            permission_classes = [IsAdminUser]
-        else:
-            permission_classes = [AllowAny]
-        return [permission() for permission in permission_classes]
+        if self.action in _WRITE_ACTIONS:
+            return _ADMIN_PERMISSIONS
+        return _OPEN_PERMISSIONS
 
     def get_queryset(self):
         """Filter queryset for user."""
-        assigned_only = bool(
-            int(self.request.query_params.get('assigned_only', 0))
-        )
+        assigned_only = self._flag('assigned_only')
         queryset = self.queryset
         if assigned_only:
-            queryset = queryset.filter(cottage__isnull=False)
-        return queryset.order_by('-name').distinct()
+            queryset = queryset.filter(cottage__isnull=False).distinct()
+        return queryset.order_by('-name')
 
 
 class AmenitiesViewSet(BaseCottageAttrViewSet,
@@ -120,7 +179,8 @@ class AmenitiesViewSet(BaseCottageAttrViewSet,
     queryset = Amenities.objects.all()
 
 
-class BookingViewSet(mixins.UpdateModelMixin,
+class BookingViewSet(QueryParamFlagMixin,
+                     mixins.UpdateModelMixin,
                      mixins.DestroyModelMixin,
                      mixins.ListModelMixin,
                      viewsets.GenericViewSet,
@@ -129,24 +189,21 @@ class BookingViewSet(mixins.UpdateModelMixin,
     authentication_classes = (TokenAuthentication,)
     serializer_class = serializers.BookingSerializer
     queryset = Booking.objects.all()
+    pagination_class = LimitOffsetPagination
 
     def get_permissions(self):
         """Set permissions based on the action."""
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            permission_classes = [IsAuthenticated]
-        else:
-            permission_classes = [AllowAny]
-        return [permission() for permission in permission_classes]
+        if self.action in _WRITE_ACTIONS:
+            return _AUTHENTICATED_PERMISSIONS
+        return _OPEN_PERMISSIONS
 
     def get_queryset(self):
         """Filter queryset for user."""
-        assigned_only = bool(
-            int(self.request.query_params.get('assigned_only', 0))
-        )
+        assigned_only = self._flag('assigned_only')
         queryset = self.queryset
         if assigned_only:
             queryset = queryset.filter(cottage__isnull=False)
-        return queryset.order_by('-check_in').distinct()
+        return queryset.order_by('-check_in')
 
 
 class CheckAvailabilityView(generics.GenericAPIView):
@@ -160,15 +217,25 @@ class CheckAvailabilityView(generics.GenericAPIView):
         check_in = serializer.validated_data['check_in']
         check_out = serializer.validated_data['check_out']
 
-        cottage = Cottage.objects.get(id=cottage_id)
-
         overlapping_bookings = Booking.objects.filter(
-            cottage=cottage,
+            cottage_id=cottage_id,
             check_in__lt=check_out,
             check_out__gt=check_in
         )
 
-        if overlapping_bookings.exists():
+        has_overlap = (
+            Cottage.objects.filter(id=cottage_id)
+            .annotate(has_overlap=Exists(overlapping_bookings))
+            .values_list('has_overlap', flat=True)
+            .first()
+        )
+
+        if has_overlap is None:
+            return Response({
+                'message': 'Cottage not found.'
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        if has_overlap:
             return Response({
                 'available': False,
                 'message': 'The cottage is not available for the selected dates.'
@@ -189,30 +256,32 @@ class CottageAvailabilityView(generics.GenericAPIView):
         serializer.is_valid(raise_exception=True)
         cottage_id = serializer.validated_data['cottage']
 
-        try:
-            cottage = Cottage.objects.get(id=cottage_id)
-        except Cottage.DoesNotExist:
+        if not Cottage.objects.filter(id=cottage_id).exists():
             return Response({
                 'message': 'Cottage not found.'
             }, status=status.HTTP_404_NOT_FOUND)
 
-        bookings = Booking.objects.filter(cottage=cottage).order_by('check_in')
+        current_date = timezone.localdate()
+        end_of_year = date(current_date.year, 12, 31)
 
-        available_dates = []
+        bookings = Booking.objects.filter(
+            cottage_id=cottage_id,
+            check_out__gte=current_date,
+            check_in__lte=end_of_year,
+        ).order_by('check_in').values_list('check_in', 'check_out')
 
-        current_date = timezone.now().date()
-        end_of_year = current_date.replace(month=12, day=31)
+        available_dates = []
 
         last_end_date = current_date
 
-        for booking in bookings:
-            if last_end_date < booking.check_in:
+        for check_in, check_out in bookings:
+            if last_end_date < check_in:
                 available_dates.append({
                     'from': last_end_date,
-                    'to': booking.check_in
+                    'to': check_in
                 })
 
-            last_end_date = max(last_end_date, booking.check_out)
+            last_end_date = max(last_end_date, check_out)
 
         if last_end_date <= end_of_year:
             available_dates.append({
@@ -230,18 +299,28 @@ class FinancialReportView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        if not request.user.is_authenticated:
-            raise PermissionDenied('Authentication required to view financial summary.')
-
-        total_income = Booking.objects.filter(cottage__user=request.user).aggregate(total=Sum('price'))[
-                           'total'] or Decimal('0')
-
-        total_expenses = Decimal(
-            Cottage.objects.filter(user=request.user).aggregate(total=Sum('expenses'))['total'] or '0')
-        net_profit = total_income - total_expenses
+        summary = FinancialSummary.objects.filter(user=request.user).first()
+        if summary is None:
+            income_per_cottage = Booking.objects.filter(
+                cottage=OuterRef('pk')
+            ).values('cottage').annotate(total=Sum('price')).values('total')
+
+            totals = Cottage.objects.filter(user=request.user).annotate(
+                income=Coalesce(Subquery(income_per_cottage), Value(Decimal('0')))
+            ).aggregate(
+                total_income=Sum('income'),
+                total_expenses=Sum('expenses'),
+            )
+            summary, _ = FinancialSummary.objects.get_or_create(
+                user=request.user,
+                defaults={
+                    'total_income': totals['total_income'] or Decimal('0'),
+                    'total_expenses': totals['total_expenses'] or Decimal('0'),
+                },
+            )
 
         return Response({
-            'total_income': total_income,
-            'total_expenses': total_expenses,
-            'net_profit': net_profit
+            'total_income': summary.total_income,
+            'total_expenses': summary.total_expenses,
+            'net_profit': summary.total_income - summary.total_expenses
         })